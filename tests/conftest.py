@@ -0,0 +1,39 @@
+"""
+Shared fixtures for the Mergington High School API test suite.
+
+Expensive one-time setup (the TestClient) lives here at session scope,
+while per-test isolation stays in the function-scoped reset_activities
+fixture, so client construction cost is paid once rather than per test.
+"""
+
+from types import MappingProxyType
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import app, activities
+
+
+@pytest.fixture(scope="session")
+def _pristine_participants():
+    """
+    Session-wide snapshot of each activity's original participants, taken
+    once before any test mutates state. The read-only mapping of tuples
+    makes the baseline fully immutable: tests copy from it on write and
+    can never corrupt it.
+    """
+    return MappingProxyType({
+        name: tuple(activity["participants"])
+        for name, activity in activities.items()
+    })
+
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    Fixture providing a single TestClient instance shared across the session.
+    Constructing a TestClient (HTTPX transport + ASGI plumbing) is relatively
+    expensive, and the client itself holds no per-test state, so one instance
+    can safely serve the whole run.
+    """
+    return TestClient(app)
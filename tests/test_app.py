@@ -8,50 +8,46 @@ Uses the AAA (Arrange-Act-Assert) pattern for test structure:
 """
 
 import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
 
-# Add src directory to Python path so we can import the app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from app import app, activities
+from app import activities
 
 
 @pytest.fixture
-def client():
+def reset_activities(request, _pristine_participants):
     """
-    Fixture providing a TestClient instance with a fresh copy of the app.
-    Each test gets a new client, ensuring test isolation.
+    Fixture that undoes any signups made during a test.
+    The pristine baseline is computed once per session (see conftest.py);
+    here we only rebuild the participants lists of activities the test
+    actually touched, so untouched activities cost nothing to restore.
+    Tests marked @pytest.mark.readonly skip the restore pass entirely.
     """
-    return TestClient(app)
-
-
-@pytest.fixture
-def reset_activities():
-    """
-    Fixture that resets activities to a known state before each test.
-    This ensures tests don't interfere with each other through shared state.
-    """
-    # Store original state
-    original_participants = {
-        name: activity["participants"].copy()
-        for name, activity in activities.items()
-    }
     yield
-    # Restore original state after test
-    for name, activity in activities.items():
-        activity["participants"] = original_participants[name]
+    if request.node.get_closest_marker("readonly") is not None:
+        return
+    # Restore only the activities whose participants changed
+    for name, pristine in _pristine_participants.items():
+        if len(activities[name]["participants"]) != len(pristine):
+            activities[name]["participants"] = list(pristine)
 
 
 # ============================================================================
 # Tests for GET /activities endpoint
 # ============================================================================
 
+@pytest.fixture(scope="class")
+def activities_response(client):
+    """
+    Single GET /activities response shared by every test in TestGetActivities.
+    Those tests never mutate state, so one round-trip can serve them all.
+    """
+    return client.get("/activities")
+
+
+@pytest.mark.readonly
 class TestGetActivities:
     """Test cases for retrieving activities list"""
 
-    def test_get_activities_returns_200(self, client, reset_activities):
+    def test_get_activities_returns_200(self, activities_response):
         """
         Arrange: Client is ready to make requests
         Act: Make GET request to /activities
@@ -61,12 +57,12 @@ class TestGetActivities:
         expected_status = 200
 
         # Act
-        response = client.get("/activities")
+        response = activities_response
 
         # Assert
         assert response.status_code == expected_status
 
-    def test_get_activities_returns_all_activities(self, client, reset_activities):
+    def test_get_activities_returns_all_activities(self, activities_response):
         """
         Arrange: Activities database exists with predefined activities
         Act: Make GET request to /activities
@@ -79,13 +75,13 @@ class TestGetActivities:
         }
 
         # Act
-        response = client.get("/activities")
-        activities_data = response.json()
+        activities_data = activities_response.json()
 
-        # Assert
-        assert set(activities_data.keys()) == expected_activity_names
+        # Assert (length + membership avoids building a throwaway set)
+        assert len(activities_data) == len(expected_activity_names)
+        assert all(name in activities_data for name in expected_activity_names)
 
-    def test_get_activities_returns_activity_details(self, client, reset_activities):
+    def test_get_activities_returns_activity_details(self, activities_response):
         """
         Arrange: Activities database with full activity records
         Act: Make GET request to /activities
@@ -95,16 +91,15 @@ class TestGetActivities:
         required_fields = {"description", "schedule", "max_participants", "participants"}
 
         # Act
-        response = client.get("/activities")
-        activities_data = response.json()
+        activities_data = activities_response.json()
 
         # Assert
         for activity_name, activity_data in activities_data.items():
             assert isinstance(activity_data, dict)
-            assert required_fields.issubset(set(activity_data.keys())), \
+            assert activity_data.keys() >= required_fields, \
                 f"Activity '{activity_name}' missing required fields"
 
-    def test_get_activities_participants_is_list(self, client, reset_activities):
+    def test_get_activities_participants_is_list(self, activities_response):
         """
         Arrange: Activities database with participant lists
         Act: Make GET request to /activities
@@ -114,8 +109,7 @@ class TestGetActivities:
         # (activities are already set up)
 
         # Act
-        response = client.get("/activities")
-        activities_data = response.json()
+        activities_data = activities_response.json()
 
         # Assert
         for activity_name, activity_data in activities_data.items():
@@ -130,65 +124,29 @@ class TestGetActivities:
 class TestSignupSuccess:
     """Test cases for successful activity signup"""
 
-    def test_signup_new_student_returns_200(self, client, reset_activities):
+    def test_signup_new_student(self, client, reset_activities):
         """
         Arrange: A student email not yet signed up for an activity
         Act: POST signup request with valid activity and new email
-        Assert: Status code is 200 OK
+        Assert: Status is 200 OK, student is added to the participants list,
+        and the response message mentions both the student and the activity
         """
         # Arrange
         activity_name = "Chess Club"
         new_email = "alice@mergington.edu"
+        initial_count = len(activities[activity_name]["participants"])
 
         # Act
         response = client.post(
             f"/activities/{activity_name}/signup",
             params={"email": new_email}
         )
-
-        # Assert
-        assert response.status_code == 200
-
-    def test_signup_new_student_adds_to_participants(self, client, reset_activities):
-        """
-        Arrange: A student email not yet signed up for an activity
-        Act: POST signup request with valid activity and new email
-        Assert: Student email is added to activity's participants list
-        """
-        # Arrange
-        activity_name = "Chess Club"
-        new_email = "alice@mergington.edu"
-        initial_participants = activities[activity_name]["participants"].copy()
-
-        # Act
-        response = client.post(
-            f"/activities/{activity_name}/signup",
-            params={"email": new_email}
-        )
+        response_data = response.json()
 
         # Assert
         assert response.status_code == 200
         assert new_email in activities[activity_name]["participants"]
-        assert len(activities[activity_name]["participants"]) == len(initial_participants) + 1
-
-    def test_signup_returns_success_message(self, client, reset_activities):
-        """
-        Arrange: A student email not yet signed up for an activity
-        Act: POST signup request with valid activity and new email
-        Assert: Response contains success message with student email and activity name
-        """
-        # Arrange
-        activity_name = "Tennis Club"
-        new_email = "bob@mergington.edu"
-
-        # Act
-        response = client.post(
-            f"/activities/{activity_name}/signup",
-            params={"email": new_email}
-        )
-        response_data = response.json()
-
-        # Assert
+        assert len(activities[activity_name]["participants"]) == initial_count + 1
         assert "message" in response_data
         assert new_email in response_data["message"]
         assert activity_name in response_data["message"]
@@ -202,13 +160,11 @@ class TestSignupSuccess:
         # Arrange
         activity_name = "Drama Club"
         new_emails = ["charlie@mergington.edu", "diana@mergington.edu", "event@mergington.edu"]
+        signup_url = f"/activities/{activity_name}/signup"
 
         # Act
         for email in new_emails:
-            response = client.post(
-                f"/activities/{activity_name}/signup",
-                params={"email": email}
-            )
+            response = client.post(signup_url, params={"email": email})
             # Assert each signup returns 200
             assert response.status_code == 200
 
@@ -228,26 +184,7 @@ class TestSignupActivityNotFound:
         """
         Arrange: An activity name that doesn't exist in the database
         Act: POST signup request with invalid activity name
-        Assert: Status code is 404 Not Found
-        """
-        # Arrange
-        nonexistent_activity = "Nonexistent Club"
-        email = "frank@mergington.edu"
-
-        # Act
-        response = client.post(
-            f"/activities/{nonexistent_activity}/signup",
-            params={"email": email}
-        )
-
-        # Assert
-        assert response.status_code == 404
-
-    def test_signup_nonexistent_activity_error_detail(self, client, reset_activities):
-        """
-        Arrange: An activity name that doesn't exist in the database
-        Act: POST signup request with invalid activity name
-        Assert: Response contains appropriate error detail message
+        Assert: Status code is 404 Not Found with an appropriate error detail
         """
         # Arrange
         nonexistent_activity = "Nonexistent Club"
@@ -261,6 +198,7 @@ class TestSignupActivityNotFound:
         response_data = response.json()
 
         # Assert
+        assert response.status_code == 404
         assert "detail" in response_data
         assert "not found" in response_data["detail"].lower()
 
@@ -292,26 +230,7 @@ class TestSignupDuplicate:
         """
         Arrange: A student already signed up for an activity
         Act: POST signup request for the same student-activity combination
-        Assert: Status code is 400 Bad Request
-        """
-        # Arrange
-        activity_name = "Chess Club"
-        existing_email = "michael@mergington.edu"  # Already in Chess Club participants
-
-        # Act
-        response = client.post(
-            f"/activities/{activity_name}/signup",
-            params={"email": existing_email}
-        )
-
-        # Assert
-        assert response.status_code == 400
-
-    def test_signup_duplicate_student_error_detail(self, client, reset_activities):
-        """
-        Arrange: A student already signed up for an activity
-        Act: POST signup request for the same student-activity combination
-        Assert: Response contains appropriate error detail message
+        Assert: Status code is 400 Bad Request with an appropriate error detail
         """
         # Arrange
         activity_name = "Chess Club"
@@ -325,6 +244,7 @@ class TestSignupDuplicate:
         response_data = response.json()
 
         # Assert
+        assert response.status_code == 400
         assert "detail" in response_data
         assert "already signed up" in response_data["detail"].lower()
 
@@ -337,19 +257,14 @@ class TestSignupDuplicate:
         # Arrange
         activity_name = "Art Studio"
         new_email = "henry@mergington.edu"
+        signup_url = f"/activities/{activity_name}/signup"
 
         # First signup should succeed
-        first_response = client.post(
-            f"/activities/{activity_name}/signup",
-            params={"email": new_email}
-        )
+        first_response = client.post(signup_url, params={"email": new_email})
         assert first_response.status_code == 200
 
         # Act - Attempt duplicate signup
-        second_response = client.post(
-            f"/activities/{activity_name}/signup",
-            params={"email": new_email}
-        )
+        second_response = client.post(signup_url, params={"email": new_email})
 
         # Assert
         assert second_response.status_code == 400
@@ -389,34 +304,12 @@ class TestSignupDuplicate:
 class TestIntegration:
     """Integration tests combining multiple operations"""
 
-    def test_get_reflects_recent_signup(self, client, reset_activities):
-        """
-        Arrange: Client ready, activities endpoint ready
-        Act: Sign up a new student, then GET activities
-        Assert: GET response shows the new student in that activity's participants
-        """
-        # Arrange
-        activity_name = "Programming Class"
-        new_email = "jack@mergington.edu"
-
-        # Act
-        signup_response = client.post(
-            f"/activities/{activity_name}/signup",
-            params={"email": new_email}
-        )
-        assert signup_response.status_code == 200
-
-        get_response = client.get("/activities")
-        activities_data = get_response.json()
-
-        # Assert
-        assert new_email in activities_data[activity_name]["participants"]
-
     def test_workflow_signup_list_verify(self, client, reset_activities):
         """
         Arrange: Fresh activities data
         Act: 1) Get initial activities, 2) Sign up new student, 3) Get activities again
-        Assert: 1) Initial list has activity, 2) Signup succeeds, 3) Updated list shows new student
+        Assert: 1) Initial list has activity, 2) Signup succeeds with a message,
+        3) Updated list shows new student
         """
         # Arrange
         activity_name = "Gym Class"
@@ -438,6 +331,7 @@ class TestIntegration:
 
         # Assert
         assert signup_response.status_code == 200
+        assert new_email in signup_response.json()["message"]
         assert new_email not in initial_participants
         assert new_email in final_participants
         assert len(final_participants) == len(initial_participants) + 1